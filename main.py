@@ -19,76 +19,206 @@ Usage examples:
 """
 
 import argparse
+import os
 import random
 import sys
-from collections import Counter
-from dataclasses import dataclass
+from array import array
+from itertools import combinations_with_replacement
+from multiprocessing import Pool
 try:
     import tkinter as tk
     from tkinter import simpledialog, messagebox
     TK_AVAILABLE = True
 except Exception:
     TK_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # numba is optional: without it the decorated functions run as plain Python
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# special card ids
+CARD_BONUS300 = 0
+CARD_BONUS400 = 1
+CARD_BONUS500 = 2
+CARD_NO_DICE = 3
+CARD_MUST_BUST = 4
+CARD_DOUBLE_TROUBLE = 5
+
+# card id -> (number in the deck, special_state key, value); the value of a
+# bonus card is its bank bonus
+_CARDS = {
+    CARD_BONUS300: (6, 'bonus', 300),
+    CARD_BONUS400: (4, 'bonus', 400),
+    CARD_BONUS500: (2, 'bonus', 500),
+    CARD_NO_DICE: (3, 'no_dice', True),
+    CARD_MUST_BUST: (3, 'must_bust', True),
+    CARD_DOUBLE_TROUBLE: (2, 'double_trouble', True),
+}
+# the tuples below are indexed by card id (the numba kernel needs plain tuples)
+_DECK_COUNTS = tuple(_CARDS[card][0] for card in range(len(_CARDS)))
+_CARD_EFFECTS = tuple(_CARDS[card][1:] for card in range(len(_CARDS)))
+
+_CARD_DESCRIPTIONS = {
+    'bonus': "BONUS {} if you bank this turn.",
+    'no_dice': "NO DICE - turn skipped.",
+    'must_bust': "MUST BUST - you cannot bank; if you bust you still keep your turn points.",
+    'double_trouble': "DOUBLE TROUBLE - you must fill (use all dice) twice before banking is allowed.",
+}
+
+# card id -> (special_state key, value, description shown when drawn)
+CARD_HANDLERS = tuple((kind, value, _CARD_DESCRIPTIONS[kind].format(value)) for kind, value in _CARD_EFFECTS)
+# card id -> bank bonus, for the numba kernel
+_CARD_BONUS = tuple(value if kind == 'bonus' else 0 for kind, value in _CARD_EFFECTS)
 
 
 class CardDeckSpecial:
-    def __init__(self, seed=None):
-        self.seed = seed
-        self.rng = random.Random(seed)
-        # simple deck composition
-        self.cards = (['bonus300'] * 6 + ['bonus400'] * 4 + ['bonus500'] * 2 + ['no_dice'] * 3 + ['must_bust'] * 3 + ['double_trouble'] * 2)
+    def __init__(self, seed=None, rng=None):
+        # draw from the caller's generator when given so a game uses a single RNG stream
+        self.rng = rng if rng is not None else random.Random(seed)
+        # simple deck composition; cards are drawn in order and the deck is
+        # reshuffled in place once every card has been drawn
+        self.cards = array('b', [card for card, n in enumerate(_DECK_COUNTS) for _ in range(n)])
         self.rng.shuffle(self.cards)
+        self.idx = 0
 
     def draw(self):
-        if not self.cards:
-            self.__init__(seed=self.seed)
-        return self.cards.pop()
+        card = self.cards[self.idx]
+        self.idx += 1
+        if self.idx == len(self.cards):
+            self.rng.shuffle(self.cards)
+            self.idx = 0
+        return card
 
 
-@dataclass
 class Player:
-    name: str
-    is_ai: bool = False
-    points: int = 0
+    __slots__ = ('name', 'is_ai', 'points')
 
+    def __init__(self, name, is_ai=False, points=0):
+        self.name = name
+        self.is_ai = is_ai
+        self.points = points
 
-def score_dice(dice):
-    """Score a list of dice (values 1-6).
 
-    Rules implemented:
-    - Three of a kind: face value * 100 (three 1s = 1000).
-    - Extras beyond three are NOT treated as multiplier escalation; additional dice only score separately when they are 1s or 5s.
-    - Single 1s are worth 100 each.
-    - Single 5s are worth 50 each.
+DICE_FACES = (1, 2, 3, 4, 5, 6)
+
 
-    Returns (score, breakdown) where breakdown is a dict of face->count used for scoring.
+def _score_counts(cnt):
+    """Apply the scoring rules to a 7-slot list of face counts (slot 0 unused).
+
+    Returns (score, used) where used is a 7-slot list of the count of each face used for scoring.
     """
-    cnt = Counter(dice)
+    cnt = list(cnt)
     score = 0
-    used = Counter()
+    used = [0] * 7
     # Treat three-of-a-kind as exactly three dice; extras beyond three count as singles (1s and 5s)
-    for face in range(1, 7):
-        c = cnt.get(face, 0)
+    for face in DICE_FACES:
+        c = cnt[face]
         if c >= 3:
-            base = 1000 if face == 1 else face * 100
-            score += base
-            used[face] += 3
+            score += 1000 if face == 1 else face * 100
+            used[face] = 3
             cnt[face] = c - 3
 
     # singles (only 1s and 5s score individually)
-    if cnt.get(1, 0) > 0:
+    if cnt[1]:
         score += cnt[1] * 100
         used[1] += cnt[1]
-    if cnt.get(5, 0) > 0:
+    if cnt[5]:
         score += cnt[5] * 50
         used[5] += cnt[5]
 
     return score, used
 
 
+# A roll is encoded as the base-7 number c1 + 7*c2 + 49*c3 + ... + 16807*c6 of
+# its face counts, which is simply the sum of 7**(face-1) over the dice.
+_FACE_WEIGHT = (0, 1, 7, 49, 343, 2401, 16807)
+LUT_SIZE = 7 ** 6
+
+
+def roll_index(dice):
+    """Return the base-7 face-count index of a roll into SCORE_LUT/USED_LUT."""
+    idx = 0
+    for d in dice:
+        idx += _FACE_WEIGHT[d]
+    return idx
+
+
+def _build_score_luts():
+    # Only count vectors with at most 6 dice in total can occur, so enumerate
+    # every multiset of up to 6 faces instead of the full 7**6 product.
+    score_lut = array('h', bytes(2 * LUT_SIZE))
+    used_lut = bytearray(7 * LUT_SIZE)
+    used_count_lut = bytearray(LUT_SIZE)
+    for n in range(7):
+        for faces in combinations_with_replacement(DICE_FACES, n):
+            idx = roll_index(faces)
+            cnt = [0] * 7
+            for d in faces:
+                cnt[d] += 1
+            score, used = _score_counts(cnt)
+            score_lut[idx] = score
+            used_lut[7 * idx:7 * idx + 7] = bytes(used)
+            used_count_lut[idx] = sum(used)
+    return score_lut, bytes(used_lut), bytes(used_count_lut)
+
+
+# roll_index -> score; 7-byte rows of per-face counts used (slot 0 unused); total dice used
+SCORE_LUT, USED_LUT, USED_COUNT_LUT = _build_score_luts()
+
+
+def score_dice(dice):
+    """Score a list of dice (values 1-6).
+
+    Rules implemented:
+    - Three of a kind: face value * 100 (three 1s = 1000).
+    - Extras beyond three are NOT treated as multiplier escalation; additional dice only score separately when they are 1s or 5s.
+    - Single 1s are worth 100 each.
+    - Single 5s are worth 50 each.
+
+    Scores are looked up in SCORE_LUT/USED_LUT, precomputed at import for
+    every possible roll of up to 6 dice.
+
+    Returns (score, breakdown, scoring_indices) where breakdown is a 7-slot list
+    of the count of each face used for scoring (slot 0 unused) and scoring_indices
+    is a frozenset of the positions in dice of the scoring dice.
+    """
+    positions = [[] for _ in range(7)]
+    idx = 0
+    for i, d in enumerate(dice):
+        positions[d].append(i)
+        idx += _FACE_WEIGHT[d]
+    used = list(USED_LUT[7 * idx:7 * idx + 7])
+    # the first used[face] dice of each face are the scoring ones: three of a
+    # kind takes the first three, and 1s and 5s all score
+    scoring_indices = frozenset(i for face in DICE_FACES for i in positions[face][:used[face]])
+    return SCORE_LUT[idx], used, scoring_indices
+
+
+def format_breakdown(used):
+    """Format a score_dice breakdown (or USED_LUT row) as a face->count mapping of the faces used."""
+    return str({face: used[face] for face in DICE_FACES if used[face]})
+
+
+def score_dice_fast(dice):
+    """Like score_dice but returns (score, number of dice used) without building a breakdown."""
+    idx = roll_index(dice)
+    return SCORE_LUT[idx], USED_COUNT_LUT[idx]
+
+
 def is_scoring_roll(dice):
-    s, _ = score_dice(dice)
-    return s > 0
+    # Any 1 or 5 scores; otherwise only a three of a kind can, so short-circuit
+    # on the C-level membership/count scans instead of scoring the whole roll.
+    if 1 in dice or 5 in dice:
+        return True
+    return len(dice) >= 3 and (dice.count(2) >= 3 or dice.count(3) >= 3 or dice.count(4) >= 3 or dice.count(6) >= 3)
 
 
 def make_players(n, ai_count=0):
@@ -99,34 +229,222 @@ def make_players(n, ai_count=0):
     return players
 
 
+_STATE_MASK = 0xFFFFFFFF
+
+
+def _rng_state(seed):
+    """Mix an int seed of any size or sign into a non-zero 32-bit _xorshift32 state."""
+    h = 0
+    if seed < 0:
+        seed = ~seed
+        h = 0x9E3779B9
+    while True:
+        h ^= seed & _STATE_MASK
+        # murmur3 finalizer
+        h ^= h >> 16
+        h = (h * 0x85EBCA6B) & _STATE_MASK
+        h ^= h >> 13
+        h = (h * 0xC2B2AE35) & _STATE_MASK
+        h ^= h >> 16
+        seed >>= 32
+        if not seed:
+            return h or 1
+
+
+@njit(cache=True)
+def _xorshift32(x):
+    """Advance a 32-bit xorshift RNG state.
+
+    The kernels carry this state explicitly instead of using a shared
+    generator, so they give the same results with and without numba and never
+    disturb any other code's random stream. ((x * n) >> 32) maps a state to
+    0..n-1.
+    """
+    x ^= (x << 13) & _STATE_MASK
+    x ^= x >> 17
+    x ^= (x << 5) & _STATE_MASK
+    return x
+
+
+@njit(cache=True)
+def mcts_decide(turn_points, dice_left, bonus, bonus_added, fills, must_bust, need, n_rollouts, score_lut, used_count_lut, state):
+    """Decide by Monte Carlo rollouts whether an AI should bank.
+
+    Banking now is compared against rolling the remaining dice and then
+    following a random bank/roll policy for the rest of the turn, averaged over
+    n_rollouts rollouts. Rewards are the points the turn would add to the
+    player's score capped at need, the points still required to win, so the
+    AI banks as soon as it can win. Rollouts draw from the _xorshift32 state.
+
+    Returns (bank, state): True to bank, and the advanced RNG state.
+    """
+    bank_value = turn_points
+    if bonus > 0 and fills > 0:
+        bank_value += bonus
+    if bank_value >= need:
+        return True, state
+    total = 0
+    for _ in range(n_rollouts):
+        tp = turn_points
+        dl = dice_left
+        added = bonus_added
+        f = fills
+        gained = 0
+        while True:
+            idx = 0
+            for _ in range(dl):
+                state = _xorshift32(state)
+                idx += _FACE_WEIGHT[((state * 6) >> 32) + 1]
+            score = score_lut[idx]
+            if score == 0:
+                if must_bust:
+                    gained = tp
+                break
+            tp += score
+            dl -= used_count_lut[idx]
+            if dl == 0:
+                f += 1
+                if bonus > 0 and not added:
+                    tp += bonus
+                    added = True
+                dl = 6
+            # bank or roll on with even odds
+            state = _xorshift32(state)
+            if state >> 31:
+                gained = tp
+                if bonus > 0 and f > 0:
+                    gained += bonus
+                break
+        total += min(gained, need)
+    return bank_value * n_rollouts >= total, state
+
+
+@njit(cache=True)
+def _simulate_game(is_ai, points, ai_threshold_points, ai_rollouts, points_to_win, score_lut, used_count_lut, state):
+    """Play a full non-interactive game and return the index of the winner.
+
+    Mirrors the AI/non-interactive branch of Game.play_turn using only integer
+    state so numba can compile it: is_ai is a bytes-like of 0/1 flags, points a
+    writable integer array updated in place, and rolls are scored through the
+    base-7 LUTs. AIs bank at ai_threshold_points, or by mcts_decide when
+    ai_rollouts is positive.
+
+    Dice and shuffles draw from the _xorshift32 state (see _rng_state) rather
+    than a Game's rng, so a given state plays the same game with and without
+    numba, but not the same game as Game.run's regular turn loop.
+    """
+    deck_size = 0
+    for c in _DECK_COUNTS:
+        deck_size += c
+    cards = [0] * deck_size
+    pos = 0
+    for card in range(len(_DECK_COUNTS)):
+        for _ in range(_DECK_COUNTS[card]):
+            cards[pos] = card
+            pos += 1
+    # start with an exhausted deck so the first draw shuffles
+    top = deck_size
+
+    n_players = len(points)
+    while True:
+        for i in range(n_players):
+            if top == deck_size:
+                for j in range(deck_size - 1, 0, -1):
+                    state = _xorshift32(state)
+                    k = (state * (j + 1)) >> 32
+                    cards[j], cards[k] = cards[k], cards[j]
+                top = 0
+            card = cards[top]
+            top += 1
+
+            if card != CARD_NO_DICE:
+                bonus = _CARD_BONUS[card]
+                bonus_added = False
+                dice_left = 6
+                turn_points = 0
+                fills = 0
+                while True:
+                    idx = 0
+                    for _ in range(dice_left):
+                        state = _xorshift32(state)
+                        idx += _FACE_WEIGHT[((state * 6) >> 32) + 1]
+                    score = score_lut[idx]
+                    if score == 0:
+                        # MUST BUST: keep turn points despite busting
+                        if card == CARD_MUST_BUST:
+                            points[i] += turn_points
+                        break
+                    turn_points += score
+                    dice_left -= used_count_lut[idx]
+                    if dice_left == 0:
+                        fills += 1
+                        if bonus and not bonus_added:
+                            turn_points += bonus
+                            bonus_added = True
+                        dice_left = 6
+                    if not is_ai[i]:
+                        continue
+                    if ai_rollouts > 0:
+                        bank, state = mcts_decide(turn_points, dice_left, bonus, bonus_added, fills, card == CARD_MUST_BUST,
+                                                  points_to_win - points[i], ai_rollouts, score_lut, used_count_lut, state)
+                    else:
+                        bank = turn_points >= ai_threshold_points
+                    if bank:
+                        points[i] += turn_points
+                        if bonus and fills > 0:
+                            points[i] += bonus
+                        break
+
+            if points[i] >= points_to_win:
+                return i
+
+
 class Game:
-    def __init__(self, players, points_to_win=2000, ai_threshold_points=500, seed=None, verbose=True, use_gui=False):
+    def __init__(self, players, points_to_win=2000, ai_threshold_points=500, seed=None, verbose=True, use_gui=False, ai_rollouts=0):
         self.players = players
         self.points_to_win = points_to_win
         self.ai_threshold_points = ai_threshold_points
+        # when positive, AIs decide to bank by this many mcts_decide rollouts instead of the threshold
+        self.ai_rollouts = ai_rollouts
         self.verbose = verbose
+        self.seed = seed
         self.rng = random.Random(seed)
-        self.card_deck = CardDeckSpecial(seed=seed)
+        self.card_deck = CardDeckSpecial(seed=seed, rng=self.rng)
         self.use_gui = use_gui
+        # console log lines are collected here while _batch_log is set and
+        # written in one call by _flush_log
+        self._log_buf = []
+        self._batch_log = False
+        # per-turn card effects; reset in place at the start of each turn
+        self._special_state = {
+            'bonus': 0,
+            'no_dice': False,
+            'must_bust': False,
+            'double_trouble': False,
+            'bonus_added': False
+        }
+        # one hidden root shared by every dialog, instead of a Tk interpreter per message
+        if use_gui and TK_AVAILABLE:
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        else:
+            self._tk_root = None
+
+    def close(self):
+        if self._tk_root is not None:
+            self._tk_root.destroy()
+            self._tk_root = None
 
     def _prompt(self, prompt):
-        if self.use_gui and TK_AVAILABLE:
-            root = tk.Tk(); root.withdraw()
-            try:
-                res = simpledialog.askstring("Input", prompt)
-            finally:
-                root.destroy()
+        if self._tk_root is not None:
+            res = simpledialog.askstring("Input", prompt, parent=self._tk_root)
             return res or ''
         else:
             return input(prompt)
 
     def _ack(self, prompt):
-        if self.use_gui and TK_AVAILABLE:
-            root = tk.Tk(); root.withdraw()
-            try:
-                messagebox.showinfo("Notice", prompt)
-            finally:
-                root.destroy()
+        if self._tk_root is not None:
+            messagebox.showinfo("Notice", prompt, parent=self._tk_root)
             return
         else:
             ack = ''
@@ -135,148 +453,174 @@ class Game:
             return
 
     def _info(self, msg):
-        if self.use_gui and TK_AVAILABLE:
-            root = tk.Tk(); root.withdraw()
-            try:
-                messagebox.showinfo("Info", msg)
-            finally:
-                root.destroy()
+        if self._tk_root is not None:
+            messagebox.showinfo("Info", msg, parent=self._tk_root)
+        elif self._batch_log:
+            self._log_buf.append(msg)
         else:
             print(msg)
 
+    def _flush_log(self):
+        if self._log_buf:
+            sys.stdout.write('\n'.join(self._log_buf) + '\n')
+            self._log_buf.clear()
+
     def roll(self, n):
-        return [self.rng.randint(1, 6) for _ in range(n)]
+        return self.rng.choices(DICE_FACES, k=n)
 
     def play_turn(self, player, interactive=True):
+        """Play one turn for player and return the points added to their score."""
+        if player.is_ai or not interactive:
+            # AI turns never prompt, so batch their log lines into one write per turn
+            self._batch_log = True
+            try:
+                return self._play_turn_ai(player)
+            finally:
+                self._batch_log = False
+                self._flush_log()
+        return self._play_turn_human(player)
+
+    def _start_turn(self, player):
+        """Announce the turn, draw a special card and return the turn's special_state."""
         if self.verbose:
             self._info(f"{player.name}'s turn (score {player.points}/{self.points_to_win})")
 
         # draw a special card at start of turn
         special = self.card_deck.draw()
-        special_state = {
-            'bonus': 0,
-            'no_dice': False,
-            'must_bust': False,
-            'double_trouble': False
-        }
-        if special.startswith('bonus'):
-            special_state['bonus'] = int(special.replace('bonus', ''))
-            if self.verbose:
-                self._info(f"Drew card: BONUS {special_state['bonus']} if you bank this turn.")
-        elif special == 'no_dice':
-            special_state['no_dice'] = True
-            if self.verbose:
-                self._info("Drew card: NO DICE - turn skipped.")
-        elif special == 'must_bust':
-            special_state['must_bust'] = True
-            if self.verbose:
-                self._info("Drew card: MUST BUST - you cannot bank; if you bust you still keep your turn points.")
-        elif special == 'double_trouble':
-            special_state['double_trouble'] = True
-            if self.verbose:
-                self._info("Drew card: DOUBLE TROUBLE - you must fill (use all dice) twice before banking is allowed.")
-
+        special_state = self._special_state
+        special_state['bonus'] = 0
+        special_state['no_dice'] = False
+        special_state['must_bust'] = False
+        special_state['double_trouble'] = False
+        special_state['bonus_added'] = False
+        kind, value, description = CARD_HANDLERS[special]
+        special_state[kind] = value
+        if self.verbose:
+            self._info(f"Drew card: {description}")
+        return special_state
+
+    def _play_turn_ai(self, player):
+        # Non-interactive turn: keep every scoring die and, for AI players, bank
+        # once the turn total reaches the threshold. Non-AI players in a
+        # non-interactive game keep rolling until they bust.
+        special_state = self._start_turn(player)
         if special_state['no_dice']:
-            if not player.is_ai and interactive:
-                self._ack("No dice this turn — press 'y' to continue:")
             return 0
 
+        # bind hot attributes to locals for the roll loop below
+        verbose = self.verbose
+        is_ai = player.is_ai
+        name = player.name
+        ai_thresh = self.ai_threshold_points
+        ai_rollouts = self.ai_rollouts
+        bonus = special_state['bonus']
+        must_bust = special_state['must_bust']
+
         dice_left = 6
         turn_points = 0
         fills = 0
 
         while True:
             roll = self.roll(dice_left)
-            score, breakdown = score_dice(roll)
-            if self.verbose:
-                if self.verbose:
-                    self._info(f"Rolled: {roll} -> scoring {score} (breakdown: {dict(breakdown)})")
+            score, used_count = score_dice_fast(roll)
+            if verbose:
+                # read the breakdown straight from the LUT row; only built when logged
+                idx = roll_index(roll)
+                self._info(f"Rolled: {roll} -> scoring {score} (breakdown: {format_breakdown(USED_LUT[7 * idx:7 * idx + 7])})")
 
             if score == 0:
-                if self.verbose:
-                    if self.verbose:
-                        self._info(f"{player.name} busted and scored 0 this turn.")
+                if verbose:
+                    self._info(f"{name} busted and scored 0 this turn.")
                 # If must_bust card is active: player keeps turn points on bust
-                if special_state.get('must_bust'):
-                    if self.verbose:
-                        if self.verbose:
-                            self._info(f"{player.name} had MUST BUST: keeps {turn_points} points despite busting.")
+                if must_bust:
+                    if verbose:
+                        self._info(f"{name} had MUST BUST: keeps {turn_points} points despite busting.")
                     player.points += turn_points
-                # else normal bust
-                # If human interactive, require acknowledgement before continuing
-                if interactive and not player.is_ai:
-                    self._ack("You busted — press 'y' to continue:")
+                    return turn_points
                 return 0
 
-            # interactive: let player select which scoring dice to keep
-            if player.is_ai or not interactive:
-                # Simple AI/hardcoded policy: keep all scoring dice that give positive score
-                taken_score = score
-                # For simplicity, assume taking all scoring dice
-                turn_points += taken_score
-                # determine how many dice were used
-                used_count = sum(breakdown.values())
-                dice_left -= used_count
-                if dice_left == 0:
-                    # hot dice: player used all dice once during this turn
-                    fills += 1
-                    # If a bonus card was drawn, add it to the running turn total when the player fills.
-                    if special_state.get('bonus') and not special_state.get('bonus_added'):
-                        turn_points += special_state['bonus']
-                        special_state['bonus_added'] = True
-                        if self.verbose and player.is_ai:
-                            self._info(f"{player.name} (AI) receives bonus {special_state['bonus']} added to turn total for filling this turn.")
-                    dice_left = 6
-                if self.verbose and player.is_ai:
-                    if self.verbose and player.is_ai:
-                        self._info(f"{player.name} (AI) takes {taken_score} points this roll, turn total {turn_points}.")
-                # AI bank decision
-                if player.is_ai and turn_points >= self.ai_threshold_points:
-                    # AI banks; include bonus only if the player filled (used all dice) this turn
-                    player.points += turn_points
-                    if special_state.get('bonus') and fills > 0:
-                        player.points += special_state['bonus']
-                    if self.verbose:
-                        if self.verbose:
-                            self._info(f"{player.name} (AI) banks and now has {player.points} points.")
-                    return turn_points
-                # continue rolling
+            # Simple AI/hardcoded policy: keep all scoring dice that give positive score
+            turn_points += score
+            dice_left -= used_count
+            if dice_left == 0:
+                # hot dice: player used all dice once during this turn
+                fills += 1
+                # If a bonus card was drawn, add it to the running turn total when the player fills.
+                if bonus and not special_state['bonus_added']:
+                    turn_points += bonus
+                    special_state['bonus_added'] = True
+                    if verbose and is_ai:
+                        self._info(f"{name} (AI) receives bonus {bonus} added to turn total for filling this turn.")
+                dice_left = 6
+            if verbose and is_ai:
+                self._info(f"{name} (AI) takes {score} points this roll, turn total {turn_points}.")
+            # AI bank decision
+            if not is_ai:
                 continue
+            if ai_rollouts > 0:
+                # seed the rollouts from the game's stream so --seed stays reproducible
+                bank, _ = mcts_decide(turn_points, dice_left, bonus, special_state['bonus_added'], fills, must_bust,
+                                      self.points_to_win - player.points, ai_rollouts, SCORE_LUT, USED_COUNT_LUT,
+                                      _rng_state(self.rng.getrandbits(32)))
+            else:
+                bank = turn_points >= ai_thresh
+            if bank:
+                # AI banks; include bonus only if the player filled (used all dice) this turn
+                player.points += turn_points
+                if bonus and fills > 0:
+                    player.points += bonus
+                    turn_points += bonus
+                if verbose:
+                    self._info(f"{name} (AI) banks and now has {player.points} points.")
+                return turn_points
+
+    def _play_turn_human(self, player):
+        special_state = self._start_turn(player)
+        if special_state['no_dice']:
+            self._ack("No dice this turn — press 'y' to continue:")
+            return 0
+
+        verbose = self.verbose
+        name = player.name
+        bonus = special_state['bonus']
+        must_bust = special_state['must_bust']
+        double_trouble = special_state['double_trouble']
+
+        dice_left = 6
+        turn_points = 0
+        fills = 0
+
+        while True:
+            roll = self.roll(dice_left)
+            score, breakdown, scoring_indices = score_dice(roll)
+            # the breakdown is always shown to a human, so format it once per roll
+            breakdown_text = format_breakdown(breakdown)
+            if verbose:
+                self._info(f"Rolled: {roll} -> scoring {score} (breakdown: {breakdown_text})")
+
+            if score == 0:
+                if verbose:
+                    self._info(f"{name} busted and scored 0 this turn.")
+                # If must_bust card is active: player keeps turn points on bust
+                if must_bust:
+                    if verbose:
+                        self._info(f"{name} had MUST BUST: keeps {turn_points} points despite busting.")
+                    player.points += turn_points
+                # else normal bust
+                # require acknowledgement before continuing
+                self._ack("You busted — press 'y' to continue:")
+                return turn_points if must_bust else 0
 
-            # Human interactive: ask which dice to keep or bank
             # Present roll and scoring breakdown; accept indices to keep or 'b' to bank
             # Human interactive: show indexed roll and ask which scoring dice to keep
-            print(" Scoring dice breakdown:")
             if not self.use_gui:
                 print(" Scoring dice breakdown:")
-                print(f"  {dict(breakdown)}")
-            # show roll with indices
-            indexed = ' '.join(f"[{i+1}:{v}]" for i, v in enumerate(roll))
+                print(f"  {breakdown_text}")
 
-            # In GUI mode, show roll and breakdown in a dialog
-            if self.use_gui and TK_AVAILABLE:
-                root = tk.Tk(); root.withdraw()
-                try:
-                    messagebox.showinfo("Roll", f"Roll: {indexed}\nScoring: {dict(breakdown)}")
-                finally:
-                    root.destroy()
-
-            # determine which positions in the roll are scoring (indices 0-based)
-            face_positions = {}
-            for i, v in enumerate(roll):
-                face_positions.setdefault(v, []).append(i)
-            scoring_indices = set()
-            for face, positions in face_positions.items():
-                c = len(positions)
-                if c >= 3:
-                    # first three of a kind are scoring
-                    scoring_indices.update(positions[:3])
-                    # extras of 1s or 5s also score individually
-                    if face in (1, 5) and c > 3:
-                        scoring_indices.update(positions[3:])
-                else:
-                    if face in (1, 5):
-                        scoring_indices.update(positions)
+            # In GUI mode, show roll with indices and breakdown in a dialog
+            if self._tk_root is not None:
+                indexed = ' '.join(f"[{i+1}:{v}]" for i, v in enumerate(roll))
+                messagebox.showinfo("Roll", f"Roll: {indexed}\nScoring: {breakdown_text}", parent=self._tk_root)
 
             while True:
                 choice = self._prompt("(k)eep all scoring dice, (c)hoose indices from roll (e.g. 1 3), or (b)ank? [k/c/b]: ").strip().lower()
@@ -284,17 +628,17 @@ class Game:
                     break
             if choice == 'b':
                 # Bank allowed? for DOUBLE TROUBLE require at least 2 fills
-                if special_state.get('double_trouble') and fills < 2:
+                if double_trouble and fills < 2:
                     self._info("DOUBLE TROUBLE active: you must fill twice before banking is allowed.")
                     continue
                 player.points += turn_points
-                if self.verbose:
-                    self._info(f"{player.name} banks {turn_points} points and now has {player.points}.")
+                if verbose:
+                    self._info(f"{name} banks {turn_points} points and now has {player.points}.")
                 return turn_points
 
             if choice == 'k':
                 taken_score = score
-                taken_count = sum(breakdown.values())
+                taken_count = sum(breakdown)
             else:
                 # choose indices
                 try:
@@ -308,7 +652,7 @@ class Game:
                         print(" You selected non-scoring dice; choose only scoring dice.")
                         continue
                     chosen = [roll[i] for i in idx]
-                    taken_score, _ = score_dice(chosen)
+                    taken_score, _ = score_dice_fast(chosen)
                     if taken_score == 0:
                         print(" Chosen dice do not score; choose scoring dice.")
                         continue
@@ -323,15 +667,15 @@ class Game:
             if dice_left == 0:
                 fills += 1
                 # If a bonus card was drawn, add it to the running turn total when the player fills.
-                if special_state.get('bonus') and not special_state.get('bonus_added'):
-                    turn_points += special_state['bonus']
+                if bonus and not special_state['bonus_added']:
+                    turn_points += bonus
                     special_state['bonus_added'] = True
-                    if self.verbose:
-                        self._info(f"{player.name} receives bonus {special_state['bonus']} added to turn total for filling this turn.")
+                    if verbose:
+                        self._info(f"{name} receives bonus {bonus} added to turn total for filling this turn.")
                 dice_left = 6
 
-            if self.verbose:
-                self._info(f"{player.name} keeps {taken_score} points this pick; turn total {turn_points}. Dice left: {dice_left}")
+            if verbose:
+                self._info(f"{name} keeps {taken_score} points this pick; turn total {turn_points}. Dice left: {dice_left}")
 
             # ask to continue or bank (prompt every scoring roll)
             cont = ''
@@ -339,20 +683,69 @@ class Game:
                 cont = self._prompt("(r)oll again or (b)ank? [r/b]: ").strip().lower()
             if cont == 'b':
                 player.points += turn_points
-                if self.verbose:
-                    self._info(f"{player.name} banks {turn_points} points and now has {player.points}.")
+                if verbose:
+                    self._info(f"{name} banks {turn_points} points and now has {player.points}.")
                 return turn_points
             # else roll again with remaining dice
 
     def run(self, interactive=True):
+        # the integer-only kernel only pays off once numba has compiled it; as
+        # plain Python it is slower than the play_turn loop below
+        if NUMBA_AVAILABLE and not interactive and not self.verbose:
+            return self._run_simulated()
+        points_to_win = self.points_to_win
         while True:
             for player in self.players:
-                self.play_turn(player, interactive=interactive)
-                if player.points >= self.points_to_win:
+                # a player's score only changes on turns where they add points
+                if self.play_turn(player, interactive=interactive) and player.points >= points_to_win:
                     if self.verbose:
                         print(f"\n{player.name} wins with {player.points} points!")
                     return player
 
+    def _run_simulated(self):
+        is_ai = bytes(1 if p.is_ai else 0 for p in self.players)
+        points = array('q', (p.points for p in self.players))
+        # any seed, including a negative one, maps to a fixed kernel state
+        state = _rng_state(self.seed if self.seed is not None else self.rng.getrandbits(32))
+        winner = _simulate_game(is_ai, points, self.ai_threshold_points, self.ai_rollouts, self.points_to_win,
+                                SCORE_LUT, USED_COUNT_LUT, state)
+        for player, pts in zip(self.players, points):
+            player.points = pts
+        return self.players[winner]
+
+
+def _run_games(job):
+    """Run simulated games start..stop-1 for the parsed args and return their win counts."""
+    args, start, stop = job
+    ai_count = args.players if args.ai else args.ai_count
+    wins = {}
+    if NUMBA_AVAILABLE:
+        # call the compiled kernel directly with reused buffers; building a Game
+        # per game (rng, shuffled deck, Player objects) costs more than the game
+        players = make_players(args.players, ai_count=ai_count)
+        names = [p.name for p in players]
+        is_ai = bytes(1 if p.is_ai else 0 for p in players)
+        zeros = array('q', bytes(8 * len(players)))
+        points = array('q', zeros)
+        rng = random.Random() if args.seed is None else None
+        for s in range(start, stop):
+            points[:] = zeros
+            # same per-game seed, and so the same game, as Game(seed=args.seed + s).run()
+            state = _rng_state(args.seed + s if rng is None else rng.getrandbits(32))
+            winner = _simulate_game(is_ai, points, args.ai_threshold_points, args.ai_rollouts, args.points_to_win,
+                                    SCORE_LUT, USED_COUNT_LUT, state)
+            wins[names[winner]] = wins.get(names[winner], 0) + 1
+        return wins
+    for s in range(start, stop):
+        players = make_players(args.players, ai_count=ai_count)
+        # derive a per-game seed so seeded runs are reproducible without replaying one game
+        seed = args.seed + s if args.seed is not None else None
+        game = Game(players, points_to_win=args.points_to_win, ai_threshold_points=args.ai_threshold_points, seed=seed, verbose=False, ai_rollouts=args.ai_rollouts)
+        winner = game.run(interactive=False)
+        if winner:
+            wins[winner.name] = wins.get(winner.name, 0) + 1
+    return wins
+
 
 def parse_args():
     p = argparse.ArgumentParser(description='Fill or Bust - dice-based CLI')
@@ -361,6 +754,7 @@ def parse_args():
     p.add_argument('--ai', action='store_true', help='Make all players AI')
     p.add_argument('--ai-count', type=int, default=0, help='Number of AI players (last N players will be AI)')
     p.add_argument('--ai-threshold-points', type=int, default=500, help='AI banks after this many points in a turn')
+    p.add_argument('--ai-rollouts', type=int, default=0, help='If > 0, AI decides whether to bank by this many Monte Carlo rollouts instead of the threshold')
     p.add_argument('--points-to-win', type=int, default=2000, help='Points required to win')
     p.add_argument('--simulate', type=int, default=0, help='Run N simulated games (non-interactive)')
     p.add_argument('--seed', type=int, default=None)
@@ -373,37 +767,45 @@ def main():
     ai_count = args.players if args.ai else args.ai_count
     if args.simulate > 0:
         wins = {}
-        for s in range(args.simulate):
-            players = make_players(args.players, ai_count=ai_count)
-            game = Game(players, points_to_win=args.points_to_win, ai_threshold_points=args.ai_threshold_points, seed=args.seed, verbose=False)
-            winner = game.run(interactive=False)
-            if winner:
-                wins[winner.name] = wins.get(winner.name, 0) + 1
+        # games are independent, so spread contiguous batches of them across
+        # worker processes; batching keeps the per-task IPC cost off each game
+        cpus = os.cpu_count() or 1
+        chunksize = max(1, args.simulate // (4 * cpus))
+        jobs = [(args, s, min(s + chunksize, args.simulate)) for s in range(0, args.simulate, chunksize)]
+        processes = min(len(jobs), cpus)
+        if processes == 1:
+            # a single worker gains nothing from a pool; skip the process startup
+            results = [_run_games((args, 0, args.simulate))]
+        else:
+            with Pool(processes) as pool:
+                results = list(pool.imap_unordered(_run_games, jobs))
+        for batch_wins in results:
+            for name, n in batch_wins.items():
+                wins[name] = wins.get(name, 0) + n
         print(f"Simulated {args.simulate} games. Win counts: {wins}")
         return
 
     players = make_players(args.players, ai_count=ai_count)
     human_count = args.players - ai_count
-    # name prompt: use GUI dialog if requested
-    if args.gui and TK_AVAILABLE:
-        root = tk.Tk(); root.withdraw()
-        try:
+    game = Game(players, points_to_win=args.points_to_win, ai_threshold_points=args.ai_threshold_points, seed=args.seed, verbose=True, use_gui=args.gui, ai_rollouts=args.ai_rollouts)
+    try:
+        # name prompt: use GUI dialog if requested
+        if game._tk_root is not None:
             for i, p in enumerate(players[:human_count]):
-                newname = simpledialog.askstring("Name", f"Name for player {p.name} (enter to keep): ") or ''
+                newname = simpledialog.askstring("Name", f"Name for player {p.name} (enter to keep): ", parent=game._tk_root) or ''
                 newname = newname.strip()
                 if newname:
                     p.name = newname
-        finally:
-            root.destroy()
-    else:
-        for i, p in enumerate(players[:human_count]):
-            newname = input(f"Name for player {p.name} (enter to keep): ").strip()
-            if newname:
-                p.name = newname
-
-    game = Game(players, points_to_win=args.points_to_win, ai_threshold_points=args.ai_threshold_points, seed=args.seed, verbose=True, use_gui=args.gui)
-    # Always run interactive mode for human play so human players are prompted each roll. yup
-    game.run(interactive=True)
+        else:
+            for i, p in enumerate(players[:human_count]):
+                newname = input(f"Name for player {p.name} (enter to keep): ").strip()
+                if newname:
+                    p.name = newname
+
+        # Always run interactive mode for human play so human players are prompted each roll. yup
+        game.run(interactive=True)
+    finally:
+        game.close()
 
 
 if __name__ == '__main__':